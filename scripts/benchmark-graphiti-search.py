@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Benchmark Graphiti search latency and hit rate on an imported group.
+
+Runs a fixed, versioned query set (built from Confluence page titles and
+known OC entities) against a group and reports p50/p95/p99 latency plus
+hit rate for each search mode: hybrid, BM25, vector and graph-distance rerank.
+A title query hits when a result was extracted from its source page; an
+entity query hits when one result names every word of the entity.
+Compare the results file before and after changing import settings.
+
+Usage:
+  cd projects/graphiti/mcp_server
+  uv run python ../../../scripts/benchmark-graphiti-search.py [--group confluence-oc] [--embedder local|openai]
+
+Requires:
+  - FalkorDB running (docker) with an imported group
+  - OPENAI_API_KEY only when --embedder openai
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from extraction_tiers import choose_tier
+
+DATA_DIR = Path(__file__).parent.parent / 'data' / 'confluence-export'
+EXPORT_FILE = DATA_DIR / 'oc-space-graphiti-2025-11-25.json'
+RESULTS_FILE = DATA_DIR / 'search-benchmark-results.json'
+
+# Bump the version whenever the query set changes; results are only
+# comparable between runs that used the same version.
+QUERY_SET_VERSION = 'v2'
+QUERY_SET_FILE = DATA_DIR / f'search-benchmark-queries-{QUERY_SET_VERSION}.json'
+TITLE_QUERY_COUNT = 30
+KNOWN_ENTITIES = [
+    'OCHCA', 'MHRS', 'Navigator', 'NAMI', 'CAT', 'Bed Board',
+    'OC Links', 'CSU', 'PEI', 'SDoH',
+]
+# Words too common in OC titles and facts to say anything about a result
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'from', 'via', 'notes', 'meeting', 'meetings',
+    'project', 'document', 'master', 'feature', 'page', 'weekly', 'sync',
+    'status', 'data', 'plan', 'agenda', 'check', 'research', 'requirements',
+    'questions', 'session', 'team', 'user', 'design', 'overview', 'internal',
+    'archived', 'level', 'sample', 'phase', 'findings', 'product', 'update', 'updates',
+}
+
+SEARCH_MODES = ['hybrid', 'bm25', 'vector', 'node_distance']
+NUM_RESULTS = 10
+WARMUP_QUERIES = 3
+
+
+def load_env():
+    """Load .env files the same way the import scripts do."""
+    for env_file in [Path('.env'), Path('../../../.env')]:
+        if env_file.exists():
+            for line in env_file.read_text().splitlines():
+                if '=' in line and not line.startswith('#'):
+                    key, _, value = line.partition('=')
+                    key = key.strip()
+                    value = value.strip().strip('"\'')
+                    if key and not os.environ.get(key):
+                        os.environ[key] = value
+
+
+def expected_terms(title: str) -> list[str]:
+    """Distinct significant words of a title, in order."""
+    words = re.findall(r'[A-Za-z][A-Za-z0-9]{2,}', title)
+    return list(dict.fromkeys(w.lower() for w in words if w.lower() not in STOPWORDS))
+
+
+def build_query_set(pages: list[dict]) -> list[dict]:
+    """Deterministically build the query set from page titles and known entities.
+
+    Title queries record the pages they came from; a title query is a hit only
+    if a result was extracted from one of those pages. Stub pages are left out
+    because the importers store them without extraction.
+    """
+    sources = {}
+    for page in pages:
+        if choose_tier(page['content'])[0].name == 'skip':
+            continue
+        title = page.get('source_description', page['name']).replace('Confluence page: ', '')
+        # Drop date prefixes such as "03/05/21: ", "10/22/2020 - " or "2022-10-05 "
+        title = re.sub(r'^\d{1,2}/\d{1,2}/\d{2,4}\s*[:\-–]?\s*', '', title)
+        title = re.sub(r'^\d{4}-\d{2}-\d{2}\s*[:\-–]?\s*', '', title).strip()
+        if expected_terms(title):
+            sources.setdefault(title, []).append(page['name'])
+
+    ordered = sorted(sources, key=str.lower)
+    step = max(1, len(ordered) // TITLE_QUERY_COUNT)
+    queries = [
+        {'id': f'title-{i:03d}', 'kind': 'title', 'query': title,
+         'expect': expected_terms(title), 'source_pages': sorted(sources[title])}
+        for i, title in enumerate(ordered[::step][:TITLE_QUERY_COUNT])
+    ]
+    queries += [
+        {'id': f'entity-{i:03d}', 'kind': 'entity', 'query': entity,
+         'expect': [w.lower() for w in entity.split()]}
+        for i, entity in enumerate(KNOWN_ENTITIES)
+    ]
+    return queries
+
+
+def load_query_set() -> list[dict]:
+    """Load the versioned query set, generating and saving it on first use."""
+    if QUERY_SET_FILE.exists():
+        return json.loads(QUERY_SET_FILE.read_text())['queries']
+
+    pages = json.loads(EXPORT_FILE.read_text())
+    queries = build_query_set(pages)
+    QUERY_SET_FILE.write_text(json.dumps({
+        'version': QUERY_SET_VERSION,
+        'source': EXPORT_FILE.name,
+        'queries': queries,
+    }, indent=2, ensure_ascii=False))
+    print(f"Wrote query set {QUERY_SET_VERSION} to {QUERY_SET_FILE}")
+    return queries
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def mentions_all(text: str, terms: list[str]) -> bool:
+    """True if every term appears in text as a whole word (so 'cat' does not match 'location')."""
+    return all(re.search(rf'\b{re.escape(term)}\b', text, re.IGNORECASE) for term in terms)
+
+
+def is_hit(results, query: dict, source_uuids: set[str]) -> bool:
+    """Title queries: a result was extracted from the query's source page.
+    Entity queries: a single result mentions every word of the entity."""
+    if query['kind'] == 'title':
+        return any(source_uuids.intersection(edge.episodes) for edge in results.edges)
+    for edge in results.edges:
+        if mentions_all(f"{edge.name} {edge.fact}", query['expect']):
+            return True
+    for node in results.nodes:
+        if mentions_all(f"{node.name} {getattr(node, 'summary', '')}", query['expect']):
+            return True
+    return False
+
+
+def make_local_embedder():
+    """Hashing bag-of-words embedder so the benchmark makes no embedding API calls.
+
+    Vector scores against OpenAI-embedded facts are not meaningful with this
+    stand-in, but the query path (and therefore latency) is the same.
+    """
+    from graphiti_core.embedder.client import EMBEDDING_DIM, EmbedderClient
+
+    class LocalHashEmbedder(EmbedderClient):
+        def __init__(self, dim: int = EMBEDDING_DIM):
+            self.dim = dim
+
+        def _embed(self, text: str) -> list[float]:
+            vector = [0.0] * self.dim
+            for token in re.findall(r'\w+', text.lower()):
+                digest = hashlib.md5(token.encode()).digest()
+                index = int.from_bytes(digest[:4], 'little') % self.dim
+                vector[index] += 1.0 if digest[4] & 1 else -1.0
+            norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+            return [v / norm for v in vector]
+
+        async def create(self, input_data) -> list[float]:
+            text = input_data if isinstance(input_data, str) else ' '.join(map(str, input_data))
+            return self._embed(text)
+
+        async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+            return [self._embed(text) for text in input_data_list]
+
+    return LocalHashEmbedder()
+
+
+def search_configs():
+    """Search config per benchmark mode (edge search, NUM_RESULTS each)."""
+    from graphiti_core.search.search_config import (
+        EdgeReranker,
+        EdgeSearchConfig,
+        EdgeSearchMethod,
+        SearchConfig,
+    )
+
+    def edge_config(methods, reranker):
+        return SearchConfig(
+            edge_config=EdgeSearchConfig(search_methods=methods, reranker=reranker),
+            limit=NUM_RESULTS,
+        )
+
+    return {
+        'hybrid': edge_config([EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity], EdgeReranker.rrf),
+        'bm25': edge_config([EdgeSearchMethod.bm25], EdgeReranker.rrf),
+        'vector': edge_config([EdgeSearchMethod.cosine_similarity], EdgeReranker.rrf),
+        'node_distance': edge_config(
+            [EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity], EdgeReranker.node_distance
+        ),
+    }
+
+
+async def run_mode(graphiti, mode, config, queries, group_id, centers, episode_uuids):
+    """Run every query in one mode; returns per-query latency and hit records."""
+    records = []
+    for query in queries:
+        source_uuids = {uuid for name in query.get('source_pages', []) for uuid in episode_uuids.get(name, [])}
+        if query['kind'] == 'title' and not source_uuids:
+            records.append({'id': query['id'], 'latency_ms': None, 'hit': False, 'skipped': 'no_source'})
+            continue
+        center = centers.get(query['id']) if mode == 'node_distance' else None
+        if mode == 'node_distance' and center is None:
+            records.append({'id': query['id'], 'latency_ms': None, 'hit': False, 'skipped': 'no_center'})
+            continue
+
+        start = time.perf_counter()
+        try:
+            results = await graphiti.search_(
+                query['query'], config=config, group_ids=[group_id], center_node_uuid=center
+            )
+        except Exception as e:
+            # e.g. FalkorDB "RediSearch: Syntax error" on titles with |, (, & ...
+            records.append({'id': query['id'], 'latency_ms': None, 'hit': False,
+                            'skipped': 'error', 'error': str(e)[:200]})
+            continue
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        if mode == 'hybrid' and results.edges:
+            # Graph-distance rerank is centred on the top hybrid hit, as in the Graphiti docs
+            centers[query['id']] = results.edges[0].source_node_uuid
+
+        records.append({
+            'id': query['id'],
+            'latency_ms': round(latency_ms, 2),
+            'hit': is_hit(results, query, source_uuids),
+            'results': len(results.edges) + len(results.nodes),
+        })
+    return records
+
+
+def summarize(records: list[dict]) -> dict:
+    measured = [r for r in records if not r.get('skipped')]
+    latencies = [r['latency_ms'] for r in measured]
+    hits = sum(1 for r in measured if r['hit'])
+    return {
+        'queries': len(measured),
+        'skipped_no_source': sum(1 for r in records if r.get('skipped') == 'no_source'),
+        'skipped_no_center': sum(1 for r in records if r.get('skipped') == 'no_center'),
+        'errors': sum(1 for r in records if r.get('skipped') == 'error'),
+        'error_queries': sorted({r['id'] for r in records if r.get('skipped') == 'error'}),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'hit_rate': round(hits / len(measured), 3) if measured else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Benchmark Graphiti search on an imported group')
+    parser.add_argument('--group', default='confluence-oc', help='group_id to query')
+    parser.add_argument('--database', help='FalkorDB database (defaults to the group name)')
+    parser.add_argument('--embedder', choices=['local', 'openai'], default='local',
+                        help='local hashing stand-in (no API calls) or OpenAI text-embedding-3-small')
+    parser.add_argument('--repeat', type=int, default=3, help='passes over the query set per mode')
+    parser.add_argument('--label', default='', help='free-form note saved with the results (e.g. import settings)')
+    args = parser.parse_args()
+
+    load_env()
+    openai_key = os.environ.get('OPENAI_API_KEY')
+    if args.embedder == 'openai' and not openai_key:
+        print("ERROR: OPENAI_API_KEY not found (required for --embedder openai)")
+        sys.exit(1)
+
+    from graphiti_core import Graphiti
+    from graphiti_core.llm_client import OpenAIClient
+    from graphiti_core.llm_client.config import LLMConfig
+    from graphiti_core.embedder import OpenAIEmbedder
+    from graphiti_core.embedder.openai import OpenAIEmbedderConfig
+    from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
+    from graphiti_core.driver.falkordb_driver import FalkorDriver
+    from graphiti_core.nodes import EpisodicNode
+
+    print("=" * 60)
+    print("Graphiti Search Benchmark")
+    print("=" * 60)
+
+    queries = load_query_set()
+    print(f"Query set {QUERY_SET_VERSION}: {len(queries)} queries")
+    print(f"Group: {args.group}  Embedder: {args.embedder}  Repeat: {args.repeat}")
+
+    if args.embedder == 'openai':
+        embedder = OpenAIEmbedder(config=OpenAIEmbedderConfig(
+            api_key=openai_key, embedding_model='text-embedding-3-small'))
+    else:
+        embedder = make_local_embedder()
+
+    # None of the benchmarked modes call the LLM or cross-encoder, but Graphiti
+    # builds OpenAI clients by default, so pass explicit ones that never get used.
+    llm_config = LLMConfig(api_key=openai_key or 'unused', model='gpt-4o-mini', small_model='gpt-4o-mini')
+    llm_client = OpenAIClient(config=llm_config, reasoning=None, verbosity=None)
+    cross_encoder = OpenAIRerankerClient(config=llm_config)
+
+    driver = FalkorDriver(host='localhost', port=6379, database=args.database or args.group)
+    graphiti = Graphiti(graph_driver=driver, llm_client=llm_client, embedder=embedder,
+                        cross_encoder=cross_encoder)
+
+    # Title queries are scored against the episodes of their source pages
+    episode_uuids = {}
+    for episode in await EpisodicNode.get_by_group_ids(driver, [args.group]):
+        episode_uuids.setdefault(episode.name, []).append(episode.uuid)
+    print(f"Episodes in group: {sum(len(v) for v in episode_uuids.values())}")
+
+    configs = search_configs()
+    centers = {}
+
+    print("Warming up...")
+    for query in queries[:WARMUP_QUERIES]:
+        try:
+            await graphiti.search_(query['query'], config=configs['hybrid'], group_ids=[args.group])
+        except Exception as e:
+            print(f"  warm-up {query['id']} failed: {str(e)[:60]}")
+
+    print("-" * 60)
+    records = {mode: [] for mode in SEARCH_MODES}
+    for _ in range(args.repeat):
+        # hybrid runs first in each pass so node_distance has its centre nodes
+        for mode in SEARCH_MODES:
+            records[mode] += await run_mode(graphiti, mode, configs[mode], queries, args.group,
+                                           centers, episode_uuids)
+
+    await graphiti.close()
+
+    summary = {mode: summarize(records[mode]) for mode in SEARCH_MODES}
+
+    print(f"{'mode':<14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'hit rate':>10}")
+    for mode, stats in summary.items():
+        print(f"{mode:<14}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['hit_rate']:>10.1%}")
+        if stats['skipped_no_source']:
+            print(f"  ({stats['skipped_no_source']} queries skipped: source page not in group)")
+        if stats['skipped_no_center']:
+            print(f"  ({stats['skipped_no_center']} queries skipped: no hybrid hit to centre on)")
+        if stats['errors']:
+            print(f"  ({stats['errors']} queries failed: {', '.join(stats['error_queries'])})")
+
+    # Append so runs for different import settings can be compared side by side
+    runs = json.loads(RESULTS_FILE.read_text()) if RESULTS_FILE.exists() else []
+    runs.append({
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'label': args.label,
+        'group_id': args.group,
+        'database': args.database or args.group,
+        'query_set': QUERY_SET_VERSION,
+        'embedder': args.embedder,
+        'repeat': args.repeat,
+        'num_results': NUM_RESULTS,
+        'modes': summary,
+    })
+    RESULTS_FILE.write_text(json.dumps(runs, indent=2))
+    print(f"\nResults saved to: {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,188 @@
+"""
+Size- and complexity-aware model tiering for Graphiti imports.
+
+Shared by the Confluence import scripts (they run with scripts/ on sys.path,
+so a plain `import extraction_tiers` works). Each record is assigned a tier
+from its body token count and entity density:
+
+  skip      empty/stub pages - stored as a raw episode, no LLM calls
+  small     short pages      - cheaper, faster model with a small output cap
+  standard  everything else  - the previous gpt-4o-mini / 4096 setup
+  large     long, entity-dense pages - larger model and output cap
+
+Pass the content that is actually sent to the LLM (after truncation), not the
+full page. Thresholds were picked from the OC space export: 44 of 234 pages have
+no body beyond the export header. At the 8000-char cap about 25 pages are 1500+
+tokens with 30%+ entity-like words; at the 6000-char cap none reach `large`, so
+those importers never pay for gpt-4o on standard-sized input.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+SKIP_MAX_TOKENS = 20
+SMALL_MAX_TOKENS = 400
+LARGE_MIN_TOKENS = 1500
+LARGE_MIN_DENSITY = 0.30
+
+# Export header lines added by export-confluence-oc.js; not page content
+HEADER_LINE = re.compile(r'^(# |Space: |URL: |Labels: |Last Modified: |Path: )')
+WORD = re.compile(r"[A-Za-z][\w'&-]*")
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding('o200k_base')
+except ImportError:
+    _encoding = None
+
+
+@dataclass(frozen=True)
+class Tier:
+    name: str
+    model: str | None
+    small_model: str | None
+    max_tokens: int
+
+
+TIERS = {
+    'skip': Tier('skip', None, None, 0),
+    'small': Tier('small', 'gpt-4.1-nano', 'gpt-4.1-nano', 1024),
+    'standard': Tier('standard', 'gpt-4o-mini', 'gpt-4o-mini', 4096),
+    'large': Tier('large', 'gpt-4o', 'gpt-4o-mini', 8192),
+}
+
+
+def count_tokens(text: str) -> int:
+    """Token count via tiktoken when installed, else the ~4 chars/token rule."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // 4
+
+
+def body_text(content: str) -> str:
+    """Page content with the export header lines removed."""
+    lines = [line for line in content.splitlines() if not HEADER_LINE.match(line)]
+    return '\n'.join(lines).strip()
+
+
+def entity_density(text: str) -> float:
+    """Share of words that look like entities (capitalised words and acronyms)."""
+    words = WORD.findall(text)
+    if not words:
+        return 0.0
+    return sum(1 for w in words if w[0].isupper()) / len(words)
+
+
+def choose_tier(content: str) -> tuple[Tier, dict]:
+    """Pick the extraction tier for a record; also returns the stats used."""
+    body = body_text(content)
+    tokens = count_tokens(body)
+    density = entity_density(body)
+    stats = {'tokens': tokens, 'density': round(density, 3)}
+
+    if tokens <= SKIP_MAX_TOKENS:
+        return TIERS['skip'], stats
+    if tokens < SMALL_MAX_TOKENS:
+        return TIERS['small'], stats
+    if tokens >= LARGE_MIN_TOKENS and density >= LARGE_MIN_DENSITY:
+        return TIERS['large'], stats
+    return TIERS['standard'], stats
+
+
+def make_tier_graphitis(openai_key, driver, embedder) -> dict:
+    """One Graphiti instance per LLM tier, sharing the driver and embedder.
+
+    Returns {tier name: (graphiti, llm_client)}; the skip tier has no entry.
+    """
+    from graphiti_core import Graphiti
+    from graphiti_core.llm_client import OpenAIClient
+    from graphiti_core.llm_client.config import LLMConfig
+
+    class CountingOpenAIClient(OpenAIClient):
+        """OpenAIClient that counts calls so the report can show calls per tier."""
+
+        calls = 0
+
+        async def generate_response(self, *args, **kwargs):
+            self.calls += 1
+            return await super().generate_response(*args, **kwargs)
+
+    graphitis = {}
+    for tier in TIERS.values():
+        if tier.model is None:
+            continue
+        llm_config = LLMConfig(api_key=openai_key, model=tier.model, small_model=tier.small_model,
+                               temperature=0, max_tokens=tier.max_tokens)
+        llm_client = CountingOpenAIClient(config=llm_config, reasoning=None, verbosity=None)
+        graphitis[tier.name] = (Graphiti(graph_driver=driver, llm_client=llm_client, embedder=embedder),
+                                llm_client)
+    return graphitis
+
+
+async def add_raw_episode(driver, name, content, source_description, reference_time, group_id):
+    """Store a skip-tier record as a plain episode without running extraction."""
+    from graphiti_core.nodes import EpisodeType, EpisodicNode
+
+    episode = EpisodicNode(
+        name=name,
+        group_id=group_id,
+        source=EpisodeType.text,
+        source_description=source_description,
+        content=content,
+        valid_at=reference_time,
+        created_at=datetime.now(timezone.utc),
+    )
+    await episode.save(driver)
+
+
+class TierReport:
+    """Per-tier pages, LLM calls and wall time, with savings against the standard tier."""
+
+    def __init__(self):
+        self.tiers = {name: {'pages': 0, 'failed': 0, 'llm_calls': 0, 'seconds': 0.0} for name in TIERS}
+
+    def start(self):
+        return time.perf_counter()
+
+    def record(self, tier: Tier, started: float, failed: bool = False):
+        """Count one attempt. Failed attempts count too, because their LLM
+        calls are already in the tier client's total."""
+        entry = self.tiers[tier.name]
+        entry['pages'] += 1
+        entry['failed'] += int(failed)
+        entry['seconds'] += time.perf_counter() - started
+
+    def summary(self, tier_graphitis: dict) -> dict:
+        """Savings per tier relative to this run's average standard-tier attempt.
+
+        LLM calls are read from each tier's client, so the counts stay right
+        when pages run concurrently. With no standard-tier attempts there is
+        no baseline and the savings columns are left out.
+        """
+        for name, (_, llm_client) in tier_graphitis.items():
+            self.tiers[name]['llm_calls'] = llm_client.calls
+
+        standard = self.tiers['standard']
+        has_baseline = standard['pages'] > 0
+        if has_baseline:
+            baseline_seconds = standard['seconds'] / standard['pages']
+            baseline_calls = standard['llm_calls'] / standard['pages']
+
+        summary = {}
+        for name, entry in self.tiers.items():
+            row = dict(entry, seconds=round(entry['seconds'], 1))
+            if has_baseline:
+                row['calls_saved'] = round(entry['pages'] * baseline_calls - entry['llm_calls'], 1)
+                row['seconds_saved'] = round(entry['pages'] * baseline_seconds - entry['seconds'], 1)
+            summary[name] = row
+        return summary
+
+    def print_summary(self, summary: dict):
+        print(f"{'tier':<10}{'pages':>7}{'failed':>8}{'calls':>7}{'time s':>9}{'calls saved':>13}{'time saved s':>14}")
+        for name, row in summary.items():
+            print(f"{name:<10}{row['pages']:>7}{row['failed']:>8}{row['llm_calls']:>7}{row['seconds']:>9.1f}"
+                  f"{row.get('calls_saved', '-'):>13}{row.get('seconds_saved', '-'):>14}")
+        if not any('calls_saved' in row for row in summary.values()):
+            print("(no standard-tier pages in this run, so there is no baseline for savings)")
@@ -11,6 +11,14 @@ import sys
 from pathlib import Path
 from datetime import datetime, timezone
 
+import ingest_scheduler
+from extraction_tiers import TierReport, add_raw_episode, choose_tier, make_tier_graphitis
+from ingest_scheduler import parse_reference_time
+
+CONCURRENCY = 1  # One group: concurrent add_episode calls race in dedup and hit rate limits
+MAX_CONTENT_CHARS = 6000  # Content sent to the LLM is truncated to manage costs
+
+
 async def main():
     # Load environment
     for env_file in [Path('.env'), Path('../../../.env')]:
@@ -29,9 +37,6 @@ async def main():
         sys.exit(1)
 
     # Initialize components
-    from graphiti_core import Graphiti
-    from graphiti_core.llm_client import OpenAIClient
-    from graphiti_core.llm_client.config import LLMConfig
     from graphiti_core.embedder import OpenAIEmbedder
     from graphiti_core.embedder.openai import OpenAIEmbedderConfig
     from graphiti_core.driver.falkordb_driver import FalkorDriver
@@ -42,11 +47,10 @@ async def main():
     print("=" * 60)
 
     driver = FalkorDriver(host='localhost', port=6379, database='confluence-oc')
-    llm_config = LLMConfig(api_key=openai_key, model='gpt-4o-mini', small_model='gpt-4o-mini', temperature=0, max_tokens=4096)
-    llm_client = OpenAIClient(config=llm_config, reasoning=None, verbosity=None)
     embedder_config = OpenAIEmbedderConfig(api_key=openai_key, embedding_model='text-embedding-3-small')
     embedder = OpenAIEmbedder(config=embedder_config)
-    graphiti = Graphiti(graph_driver=driver, llm_client=llm_client, embedder=embedder)
+    tier_graphitis = make_tier_graphitis(openai_key, driver, embedder)
+    graphiti = tier_graphitis['standard'][0]
 
     print("Building indices...")
     await graphiti.build_indices_and_constraints()
@@ -61,26 +65,51 @@ async def main():
     errors = []
     total_entities = 0
     total_edges = 0
+    done = 0
+    tier_report = TierReport()
     start_time = datetime.now()
 
     print("-" * 60)
 
-    for i, page in enumerate(pages):
-        progress = f"[{i+1}/{len(pages)}]"
+    async def import_page(page):
+        nonlocal done, success, total_entities, total_edges
+        done += 1
+        progress = f"[{done}/{len(pages)}]"
         title = page.get('source_description', page['name']).replace('Confluence page: ', '')[:40]
+        reference_time = parse_reference_time(page.get('reference_time')) or datetime.now(timezone.utc)
+        tier = None
 
         try:
             # Limit content to manage costs
-            content = page['content'][:6000] if len(page['content']) > 6000 else page['content']
-
-            result = await graphiti.add_episode(
+            content = page['content'][:MAX_CONTENT_CHARS]
+            tier, _ = choose_tier(content)
+            started = tier_report.start()
+
+            if tier.name == 'skip':
+                # Stub page: keep the episode, skip entity extraction
+                await add_raw_episode(
+                    driver,
+                    name=page['name'],
+                    content=content,
+                    source_description=page.get('source_description', ''),
+                    reference_time=reference_time,
+                    group_id='confluence-oc'
+                )
+                tier_report.record(tier, started)
+                success += 1
+                print(f"{progress} OK: {title} (skip: no body)")
+                return
+
+            tier_graphiti, _ = tier_graphitis[tier.name]
+            result = await tier_graphiti.add_episode(
                 name=page['name'],
                 episode_body=content,
                 source=EpisodeType.text,
                 source_description=page.get('source_description', ''),
-                reference_time=datetime.now(timezone.utc),
+                reference_time=reference_time,
                 group_id='confluence-oc'
             )
+            tier_report.record(tier, started)
 
             entities = len(result.nodes)
             edges = len(result.edges)
@@ -88,12 +117,14 @@ async def main():
             total_edges += edges
             success += 1
 
-            print(f"{progress} OK: {title} ({entities}e/{edges}r)")
+            print(f"{progress} OK: {title} ({entities}e/{edges}r, {tier.name})")
 
             # Small delay to avoid rate limits
             await asyncio.sleep(0.5)
 
         except Exception as e:
+            if tier is not None:
+                tier_report.record(tier, started, failed=True)
             error_msg = str(e)[:60]
             print(f"{progress} ERR: {title} - {error_msg}")
             errors.append({'title': title, 'error': str(e)})
@@ -104,6 +135,17 @@ async def main():
             else:
                 await asyncio.sleep(1)
 
+    # Oldest pages first, in weekly windows. With one worker each window stays in
+    # reference_time order; more workers only pay off across separate group_ids.
+    schedule = ingest_scheduler.plan(
+        pages,
+        workers=CONCURRENCY,
+        partition_key=lambda page: 'confluence-oc',
+        time_key=lambda page: parse_reference_time(page.get('reference_time')),
+        cost_fn=lambda page: ingest_scheduler.page_cost(page['content'], MAX_CONTENT_CHARS),
+    )
+    await ingest_scheduler.run(schedule, CONCURRENCY, import_page)
+
     # Summary
     elapsed = (datetime.now() - start_time).total_seconds()
     print("\n" + "=" * 60)
@@ -120,6 +162,14 @@ async def main():
         for e in errors[:5]:
             print(f"  - {e['title']}")
 
+    print("\nExtraction tiers:")
+    tiers = tier_report.summary(tier_graphitis)
+    tier_report.print_summary(tiers)
+
+    print("\nSchedule:")
+    scheduling = ingest_scheduler.summarize(schedule, CONCURRENCY)
+    ingest_scheduler.print_summary(scheduling)
+
     await graphiti.close()
 
     # Save results
@@ -130,7 +180,9 @@ async def main():
         'entities': total_entities,
         'edges': total_edges,
         'errors': errors,
-        'elapsed_seconds': elapsed
+        'elapsed_seconds': elapsed,
+        'tiers': tiers,
+        'schedule': scheduling
     }, indent=2))
     print(f"\nResults saved to: {results_file}")
 
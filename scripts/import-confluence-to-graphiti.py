@@ -18,6 +18,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from extraction_tiers import TierReport, add_raw_episode, choose_tier, make_tier_graphitis
+
 # Add graphiti mcp_server src to path for config imports
 mcp_server_dir = Path(__file__).parent.parent / 'projects' / 'graphiti' / 'mcp_server'
 sys.path.insert(0, str(mcp_server_dir / 'src'))
@@ -56,9 +58,6 @@ async def main():
 
     # Import graphiti_core components
     try:
-        from graphiti_core import Graphiti
-        from graphiti_core.llm_client import OpenAIClient
-        from graphiti_core.llm_client.config import LLMConfig
         from graphiti_core.embedder import OpenAIEmbedder
         from graphiti_core.embedder.openai import OpenAIEmbedderConfig
         from graphiti_core.nodes import EpisodeType
@@ -107,19 +106,6 @@ async def main():
         database='confluence-import'  # Use dedicated database
     )
 
-    # Initialize LLM client with OpenAI
-    # Note: gpt-4o-mini is NOT a reasoning model, so disable reasoning/verbosity parameters
-    print("Initializing OpenAI LLM client (gpt-4o-mini)...")
-    llm_config = LLMConfig(
-        api_key=openai_key,
-        model='gpt-4o-mini',
-        small_model='gpt-4o-mini',
-        temperature=0,
-        max_tokens=4096,
-    )
-    # Pass reasoning=None, verbosity=None to disable reasoning parameters for non-reasoning models
-    llm_client = OpenAIClient(config=llm_config, reasoning=None, verbosity=None)
-
     # Initialize embedder with OpenAI
     print("Initializing OpenAI embedder...")
     embedder_config = OpenAIEmbedderConfig(
@@ -128,13 +114,11 @@ async def main():
     )
     embedder = OpenAIEmbedder(config=embedder_config)
 
-    # Create Graphiti instance (use graph_driver parameter per Context7 docs)
-    print("Creating Graphiti instance...")
-    graphiti = Graphiti(
-        graph_driver=driver,
-        llm_client=llm_client,
-        embedder=embedder
-    )
+    # Create one Graphiti instance per extraction tier (see extraction_tiers.py)
+    # Note: none of the tier models are reasoning models, so reasoning/verbosity are disabled
+    print("Creating Graphiti instances per extraction tier...")
+    tier_graphitis = make_tier_graphitis(openai_key, driver, embedder)
+    graphiti = tier_graphitis['standard'][0]
 
     # Initialize the graph (creates indices and constraints)
     print("Initializing graph indices...")
@@ -147,10 +131,12 @@ async def main():
 
     success = 0
     errors = []
+    tier_report = TierReport()
 
     for i, page in enumerate(pages):
         progress = f"[{i+1}/{len(pages)}]"
         title = page.get('source_description', 'Unknown').replace('Confluence page: ', '')
+        tier = None
 
         try:
             print(f"{progress} Processing: {title[:50]}...")
@@ -167,8 +153,26 @@ async def main():
             # Truncate content if too long (to manage API costs)
             content = page['content'][:8000] if len(page['content']) > 8000 else page['content']
 
+            tier, _ = choose_tier(content)
+            started = tier_report.start()
+
+            if tier.name == 'skip':
+                # Stub page: store the episode without entity extraction
+                await add_raw_episode(
+                    driver,
+                    name=page['name'],
+                    content=content,
+                    source_description=page.get('source_description', title),
+                    reference_time=ref_time,
+                    group_id='confluence-oc'
+                )
+                tier_report.record(tier, started)
+                success += 1
+                continue
+
             # Add as episode
-            await graphiti.add_episode(
+            tier_graphiti, _ = tier_graphitis[tier.name]
+            await tier_graphiti.add_episode(
                 name=page['name'],
                 episode_body=content,
                 source=EpisodeType.text,
@@ -176,6 +180,7 @@ async def main():
                 reference_time=ref_time,
                 group_id='confluence-oc'  # Group all OC pages together
             )
+            tier_report.record(tier, started)
 
             success += 1
 
@@ -183,6 +188,8 @@ async def main():
             await asyncio.sleep(1)
 
         except Exception as e:
+            if tier is not None:
+                tier_report.record(tier, started, failed=True)
             error_msg = str(e)
             print(f"{progress} ERROR: {title[:30]} - {error_msg[:60]}")
             errors.append({'title': title, 'error': error_msg})
@@ -207,11 +214,15 @@ async def main():
         for e in errors[:5]:
             print(f"  - {e['title'][:40]}: {e['error'][:50]}")
 
+    print("\nExtraction tiers:")
+    tier_report.print_summary(tier_report.summary(tier_graphitis))
+
     # Close connection (use graphiti.close() per Context7 docs)
     await graphiti.close()
 
     print("\nImport complete!")
     print(f"Query with: search_nodes('your query', group_ids=['confluence-oc'])")
+    print("Benchmark search with: uv run python ../../../scripts/benchmark-graphiti-search.py --database confluence-import")
     return success, errors
 
 if __name__ == "__main__":
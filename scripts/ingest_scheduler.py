@@ -0,0 +1,180 @@
+"""
+Chronological, size-balanced scheduling for Graphiti ingestion queues.
+
+Graphiti resolves contradictions using each episode's reference_time, so
+episodes in one group should arrive roughly in time order. The scheduler:
+
+  - splits records into independent partitions (e.g. group_id) that run concurrently
+  - orders each partition by reference_time and cuts it into time windows;
+    windows run one after another, so no episode starts before an earlier window finishes
+  - packs each window longest-first onto a fixed number of workers (LPT), so one big
+    page does not start last and dominate the tail; with a single worker the
+    window stays in reference_time order
+
+Shared by the import scripts (they run with scripts/ on sys.path).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from extraction_tiers import choose_tier, count_tokens
+
+WINDOW = timedelta(days=7)
+
+# Rough per-episode cost for gpt-4o-mini extraction, including the rate-limit
+# sleep. Tune against the actual times in the run summary.
+BASE_SECONDS = 8.0
+SECONDS_PER_1K_TOKENS = 4.0
+# Skip-tier pages are a single episode write with no LLM calls
+SKIP_SECONDS = 0.1
+
+
+def parse_reference_time(value) -> datetime | None:
+    """Parse an ISO timestamp (with or without 'Z'); None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def estimate_seconds(tokens: int, base=BASE_SECONDS, per_1k=SECONDS_PER_1K_TOKENS) -> float:
+    return base + per_1k * tokens / 1000
+
+
+def page_cost(content: str, max_chars: int) -> float:
+    """Predicted seconds to import a page whose content is truncated to max_chars."""
+    content = content[:max_chars]
+    tier, _ = choose_tier(content)
+    if tier.name == 'skip':
+        return SKIP_SECONDS
+    return estimate_seconds(count_tokens(content))
+
+
+@dataclass
+class Window:
+    start: datetime | None
+    items: list = field(default_factory=list)
+    predicted_seconds: float = 0.0
+    actual_seconds: float = 0.0
+
+
+@dataclass
+class Partition:
+    key: str
+    windows: list = field(default_factory=list)
+
+    @property
+    def predicted_seconds(self) -> float:
+        return sum(w.predicted_seconds for w in self.windows)
+
+    @property
+    def actual_seconds(self) -> float:
+        return sum(w.actual_seconds for w in self.windows)
+
+
+def lpt_makespan(costs: list[float], workers: int) -> float:
+    """Makespan of longest-processing-time-first packing onto `workers` workers."""
+    loads = [0.0] * max(1, workers)
+    for cost in sorted(costs, reverse=True):
+        loads[loads.index(min(loads))] += cost
+    return max(loads)
+
+
+def plan(items, workers, partition_key, time_key, cost_fn, window=WINDOW) -> list[Partition]:
+    """Build the schedule.
+
+    partition_key(item) -> str, time_key(item) -> datetime | None,
+    cost_fn(item) -> predicted seconds; each is called once per item. Items
+    without a reference_time are placed in a final window, after every
+    timestamped item in their partition. Within a window, reference_time
+    order breaks ties between equal costs; with one worker, packing cannot
+    shorten the window, so items stay in reference_time order.
+    """
+    by_partition = {}
+    for item in items:
+        by_partition.setdefault(partition_key(item), []).append((item, time_key(item), cost_fn(item)))
+
+    partitions = []
+    for key, members in by_partition.items():
+        dated = sorted((m for m in members if m[1] is not None), key=lambda m: m[1])
+        undated = [m for m in members if m[1] is None]
+
+        windows, current = [], None
+        for member in dated:
+            if current is None or member[1] - current[0][1] >= window:
+                current = [member]
+                windows.append(current)
+            else:
+                current.append(member)
+        if undated:
+            windows.append(undated)
+
+        planned = []
+        for members_in_window in windows:
+            # Earliest reference_time in the window (None for the undated window)
+            start = members_in_window[0][1]
+            if workers > 1:
+                # Longest first; the sort is stable, so equal costs keep time order
+                members_in_window = sorted(members_in_window, key=lambda m: m[2], reverse=True)
+            planned.append(Window(
+                start=start,
+                items=[item for item, _, _ in members_in_window],
+                predicted_seconds=lpt_makespan([cost for _, _, cost in members_in_window], workers),
+            ))
+        partitions.append(Partition(key=key, windows=planned))
+    return partitions
+
+
+async def _run_window(w: Window, workers: int, worker_fn):
+    queue = list(w.items)
+
+    async def worker():
+        while queue:
+            await worker_fn(queue.pop(0))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(workers, len(queue)))))
+    w.actual_seconds = time.perf_counter() - started
+
+
+async def _run_partition(partition: Partition, workers: int, worker_fn):
+    for w in partition.windows:
+        await _run_window(w, workers, worker_fn)
+
+
+async def run(partitions: list[Partition], workers: int, worker_fn):
+    """Run every partition concurrently; worker_fn(item) must handle its own errors."""
+    await asyncio.gather(*(_run_partition(p, workers, worker_fn) for p in partitions))
+
+
+def summarize(partitions: list[Partition], workers: int) -> dict:
+    """Predicted vs actual completion time per partition and overall."""
+    return {
+        'workers_per_partition': workers,
+        'predicted_seconds': round(max((p.predicted_seconds for p in partitions), default=0.0), 1),
+        'actual_seconds': round(max((p.actual_seconds for p in partitions), default=0.0), 1),
+        'partitions': {
+            p.key: {
+                'items': sum(len(w.items) for w in p.windows),
+                'windows': len(p.windows),
+                'predicted_seconds': round(p.predicted_seconds, 1),
+                'actual_seconds': round(p.actual_seconds, 1),
+            }
+            for p in partitions
+        },
+    }
+
+
+def print_summary(summary: dict):
+    print(f"{'partition':<20}{'items':>7}{'windows':>9}{'predicted s':>13}{'actual s':>10}")
+    for key, row in summary['partitions'].items():
+        print(f"{key[:20]:<20}{row['items']:>7}{row['windows']:>9}"
+              f"{row['predicted_seconds']:>13.1f}{row['actual_seconds']:>10.1f}")
+    predicted, actual = summary['predicted_seconds'], summary['actual_seconds']
+    ratio = f" ({actual / predicted:.2f}x predicted)" if predicted else ""
+    print(f"Completion: predicted {predicted:.1f}s, actual {actual:.1f}s{ratio}")
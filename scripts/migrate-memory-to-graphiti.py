@@ -17,8 +17,16 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import ingest_scheduler
+from extraction_tiers import count_tokens
+
 MEMORY_FILE = Path.home() / ".npm/_npx/15b07286cbcc3329/node_modules/@modelcontextprotocol/server-memory/dist/memory.json"
 CONCURRENCY = 2  # Reduced to avoid rate limits
+JIRA_TYPES = {'JiraTicket', 'jira-ticket', 'Jira Ticket', 'JIRA Ticket'}
+# Per-entity timing for Claude 3.5 Haiku; ingest_scheduler's defaults are for
+# gpt-4o-mini and do not apply. The base is the old 30s/entity estimate.
+HAIKU_BASE_SECONDS = 30.0
+HAIKU_SECONDS_PER_1K_TOKENS = 6.0
 BATCH_DELAY = 2  # Delay between batches (seconds)
 
 
@@ -41,34 +49,42 @@ total_count = 0
 lock = asyncio.Lock()
 
 
-async def migrate_entity(graphiti, entity, index, semaphore):
-    """Migrate a single entity with semaphore-controlled concurrency."""
+def entity_cost(entity: dict) -> float:
+    """Predicted seconds to migrate an entity, for scheduling."""
+    return ingest_scheduler.estimate_seconds(
+        count_tokens(format_entity_as_text(entity)),
+        base=HAIKU_BASE_SECONDS,
+        per_1k=HAIKU_SECONDS_PER_1K_TOKENS,
+    )
+
+
+async def migrate_entity(graphiti, entity):
+    """Migrate a single entity; concurrency is controlled by the scheduler."""
     global success_count, failed_count
 
-    async with semaphore:
-        name = entity.get('name', 'Unknown')
-        etype = entity.get('entityType', 'Unknown')
+    name = entity.get('name', 'Unknown')
+    etype = entity.get('entityType', 'Unknown')
 
-        try:
-            text = format_entity_as_text(entity)
-
-            # Add as episode
-            await graphiti.add_episode(
-                name=f"Memory import: {name}",
-                episode_body=text,
-                source_description="Migrated from Memory MCP",
-                reference_time=datetime.now()
-            )
-
-            async with lock:
-                success_count += 1
-                print(f"[{success_count + failed_count}/{total_count}] {name} ({etype})... OK")
-            return True
-        except Exception as e:
-            async with lock:
-                failed_count += 1
-                print(f"[{success_count + failed_count}/{total_count}] {name} ({etype})... FAILED: {e}")
-            return False
+    try:
+        text = format_entity_as_text(entity)
+
+        # Add as episode
+        await graphiti.add_episode(
+            name=f"Memory import: {name}",
+            episode_body=text,
+            source_description="Migrated from Memory MCP",
+            reference_time=datetime.now()
+        )
+
+        async with lock:
+            success_count += 1
+            print(f"[{success_count + failed_count}/{total_count}] {name} ({etype})... OK")
+        return True
+    except Exception as e:
+        async with lock:
+            failed_count += 1
+            print(f"[{success_count + failed_count}/{total_count}] {name} ({etype})... FAILED: {e}")
+        return False
 
 
 async def main():
@@ -168,30 +184,34 @@ async def main():
         print(f"  {t}: {count}")
     print()
 
-    # Prioritize non-JIRA first
-    jira_types = {'JiraTicket', 'jira-ticket', 'Jira Ticket', 'JIRA Ticket'}
-    prioritized = sorted(entities, key=lambda e: e.get('entityType', '') in jira_types)
-    total_count = len(prioritized)
-
-    # Calculate time estimate
-    time_per_entity = 30  # Estimated seconds per entity with parallelization
-    estimated_time = (total_count / CONCURRENCY) * time_per_entity / 60
-    print(f"Estimated time: ~{estimated_time:.0f} minutes with {CONCURRENCY}x parallelization")
+    # Everything lands in the default group and shares entity resolution, so
+    # there is one partition. Non-JIRA entities go first, as a separate phase;
+    # memory entities carry no timestamps, so each phase is a single window
+    # packed longest-first.
+    total_count = len(entities)
+    phases = {
+        'non-JIRA': [e for e in entities if e.get('entityType', '') not in JIRA_TYPES],
+        'JIRA': [e for e in entities if e.get('entityType', '') in JIRA_TYPES],
+    }
+    schedules = {
+        label: ingest_scheduler.plan(
+            phase,
+            workers=CONCURRENCY,
+            partition_key=lambda entity: 'default',
+            time_key=lambda entity: None,
+            cost_fn=entity_cost,
+        )
+        for label, phase in phases.items() if phase
+    }
+
+    predicted = sum(ingest_scheduler.summarize(s, CONCURRENCY)['predicted_seconds'] for s in schedules.values())
+    print(f"Estimated time: ~{predicted / 60:.0f} minutes with {CONCURRENCY}x parallelization")
     print("\nStarting migration in 3 seconds...")
     await asyncio.sleep(3)
 
-    # Create semaphore for rate limiting
-    semaphore = asyncio.Semaphore(CONCURRENCY)
-
-    # Create all migration tasks
     start_time = datetime.now()
-    tasks = [
-        migrate_entity(graphiti, entity, i, semaphore)
-        for i, entity in enumerate(prioritized)
-    ]
-
-    # Run all tasks concurrently (semaphore limits actual concurrency)
-    await asyncio.gather(*tasks)
+    for schedule in schedules.values():
+        await ingest_scheduler.run(schedule, CONCURRENCY, lambda entity: migrate_entity(graphiti, entity))
 
     elapsed = (datetime.now() - start_time).total_seconds()
 
@@ -203,6 +223,9 @@ async def main():
     print(f"  Time: {elapsed/60:.1f} minutes")
     print(f"  Rate: {total_count / elapsed * 60:.1f} entities/minute")
     print("=" * 60)
+    for phase, schedule in schedules.items():
+        print(f"Schedule ({phase}):")
+        ingest_scheduler.print_summary(ingest_scheduler.summarize(schedule, CONCURRENCY))
 
     await graphiti.close()
 